@@ -1002,13 +1002,15 @@ async def get_list_group(pretty: bool = False, wait_for_complete: bool = False,
         API response.
     """
     hash_ = request.query_params.get('hash', 'md5')  # Select algorithm to generate the returned checksums.
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'offset': offset,
                 'limit': limit,
                 'group_list': groups_list,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ['name'],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ['name'],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'hash_algorithm': hash_,
                 'q': q,
                 'select': select,
@@ -1240,13 +1242,15 @@ async def get_group_files(group_id: str, pretty: bool = False, wait_for_complete
         API response.
     """
     hash_ = request.query_params.get('hash', 'md5')  # Select algorithm to generate the returned checksums.
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'group_list': [group_id],
                 'offset': offset,
                 'limit': limit,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ["filename"],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ["filename"],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'hash_algorithm': hash_,
                 'q': q,
                 'select': select,
@@ -53,14 +53,15 @@ async def get_lists(pretty: bool = False, wait_for_complete: bool = False, offse
     ConnexionResponse
         API response.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'offset': offset,
                 'select': select,
                 'limit': limit,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ['relative_dirname',
-                                                                                             'filename'],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ['relative_dirname', 'filename'],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'filename': filename,
                 'relative_dirname': relative_dirname,
                 'q': q,
@@ -229,13 +230,14 @@ async def get_lists_files(pretty: bool = False, wait_for_complete: bool = False,
     ConnexionResponse
         API response.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'offset': offset,
                 'limit': limit,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ['relative_dirname',
-                                                                                             'filename'],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ['relative_dirname', 'filename'],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'search_in_fields': ['filename', 'relative_dirname'],
                 'filename': filename,
                 'relative_dirname': relative_dirname,
@@ -62,14 +62,16 @@ async def get_decoders(decoder_names: list = None, pretty: bool = False, wait_fo
     ConnexionResponse
         API response.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'names': decoder_names,
                 'offset': offset,
                 'limit': limit,
                 'select': select,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ['filename', 'position'],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ['filename', 'position'],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'q': q,
                 'filename': filename,
                 'status': status,
@@ -133,12 +135,14 @@ async def get_decoders_files(pretty: bool = False, wait_for_complete: bool = Fal
     ConnexionResponse
         API response.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'offset': offset,
                 'limit': limit,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ['filename'],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ['filename'],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'filename': filename,
                 'relative_dirname': relative_dirname,
                 'status': status,
@@ -189,13 +193,15 @@ async def get_decoders_parents(pretty: bool = False, wait_for_complete: bool = F
     ConnexionResponse
         API response.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'offset': offset,
                 'limit': limit,
                 'select': select,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ['filename', 'position'],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ['filename', 'position'],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'parents': True}
 
     dapi = DistributedAPI(f=decoder_framework.get_decoders,
@@ -374,12 +374,14 @@ async def get_log(pretty: bool = False, wait_for_complete: bool = False, offset:
     ConnexionResponse
         API response.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'offset': offset,
                 'limit': limit,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ['timestamp'],
-                'sort_ascending': False if sort is None or parse_api_param(sort, 'sort')['order'] == 'desc' else True,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ['timestamp'],
+                'sort_ascending': False if sort is None or sort_param['order'] == 'desc' else True,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'tag': tag,
                 'level': level,
                 'q': q,
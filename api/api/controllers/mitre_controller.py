@@ -76,16 +76,18 @@ async def get_references(reference_ids: list = None, pretty: bool = False, wait_
     ConnexionResponse
         API response with the MITRE's references information.
     """
+    sort_param = parse_api_param(sort, 'sort') if sort else None
+    search_param = parse_api_param(search, 'search') if search else None
     f_kwargs = {
         'filters': {
             'id': reference_ids,
         },
         'offset': offset,
         'limit': limit,
-        'sort_by': parse_api_param(sort, 'sort')['fields'] if sort else None,
-        'sort_ascending': False if not sort or parse_api_param(sort, 'sort')['order'] == 'desc' else True,
-        'search_text': parse_api_param(search, 'search')['value'] if search else None,
-        'complementary_search': parse_api_param(search, 'search')['negation'] if search else None,
+        'sort_by': sort_param['fields'] if sort else None,
+        'sort_ascending': False if not sort or sort_param['order'] == 'desc' else True,
+        'search_text': search_param['value'] if search else None,
+        'complementary_search': search_param['negation'] if search else None,
         'select': select,
         'q': q
     }
@@ -137,16 +139,18 @@ async def get_tactics(tactic_ids: list = None, pretty: bool = False, wait_for_co
     ConnexionResponse
         API response with the MITRE's tactics information.
     """
+    sort_param = parse_api_param(sort, 'sort') if sort else None
+    search_param = parse_api_param(search, 'search') if search else None
     f_kwargs = {
         'filters': {
             'id': tactic_ids,
         },
         'offset': offset,
         'limit': limit,
-        'sort_by': parse_api_param(sort, 'sort')['fields'] if sort else None,
-        'sort_ascending': False if not sort or parse_api_param(sort, 'sort')['order'] == 'desc' else True,
-        'search_text': parse_api_param(search, 'search')['value'] if search else None,
-        'complementary_search': parse_api_param(search, 'search')['negation'] if search else None,
+        'sort_by': sort_param['fields'] if sort else None,
+        'sort_ascending': False if not sort or sort_param['order'] == 'desc' else True,
+        'search_text': search_param['value'] if search else None,
+        'complementary_search': search_param['negation'] if search else None,
         'select': select,
         'q': q,
         'distinct': distinct
@@ -199,15 +203,17 @@ async def get_techniques(technique_ids: list = None, pretty: bool = False, wait_
     ConnexionResponse
         API response with the MITRE's techniques information.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'filters': {
         'id': technique_ids,
     },
         'offset': offset,
         'limit': limit,
-        'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else None,
-        'sort_ascending': False if sort is None or parse_api_param(sort, 'sort')['order'] == 'desc' else True,
-        'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-        'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+        'sort_by': sort_param['fields'] if sort is not None else None,
+        'sort_ascending': False if sort is None or sort_param['order'] == 'desc' else True,
+        'search_text': search_param['value'] if search is not None else None,
+        'complementary_search': search_param['negation'] if search is not None else None,
         'select': select, 
         'q': q,
         'distinct': distinct}
@@ -259,15 +265,17 @@ async def get_mitigations(mitigation_ids: list = None, pretty: bool = False, wai
     ConnexionResponse
         API response with the MITRE's mitigations information.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'filters': {
         'id': mitigation_ids,
     },
         'offset': offset,
         'limit': limit,
-        'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else None,
-        'sort_ascending': False if sort is None or parse_api_param(sort, 'sort')['order'] == 'desc' else True,
-        'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-        'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+        'sort_by': sort_param['fields'] if sort is not None else None,
+        'sort_ascending': False if sort is None or sort_param['order'] == 'desc' else True,
+        'search_text': search_param['value'] if search is not None else None,
+        'complementary_search': search_param['negation'] if search is not None else None,
         'select': select,
         'q': q,
         'distinct': distinct}
@@ -319,16 +327,18 @@ async def get_groups(group_ids: list = None, pretty: bool = False, wait_for_comp
     ConnexionResponse
         API response with the MITRE's groups information.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {
         'filters': {
             'id': group_ids,
         },
         'offset': offset,
         'limit': limit,
-        'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else None,
-        'sort_ascending': False if sort is None or parse_api_param(sort, 'sort')['order'] == 'desc' else True,
-        'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-        'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+        'sort_by': sort_param['fields'] if sort is not None else None,
+        'sort_ascending': False if sort is None or sort_param['order'] == 'desc' else True,
+        'search_text': search_param['value'] if search is not None else None,
+        'complementary_search': search_param['negation'] if search is not None else None,
         'select': select,
         'q': q,
         'distinct': distinct}
@@ -380,16 +390,18 @@ async def get_software(software_ids: list = None, pretty: bool = False, wait_for
     ConnexionResponse
         API response with the MITRE's software information.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {
         'filters': {
             'id': software_ids,
         },
         'offset': offset,
         'limit': limit,
-        'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else None,
-        'sort_ascending': False if sort is None or parse_api_param(sort, 'sort')['order'] == 'desc' else True,
-        'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-        'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+        'sort_by': sort_param['fields'] if sort is not None else None,
+        'sort_ascending': False if sort is None or sort_param['order'] == 'desc' else True,
+        'search_text': search_param['value'] if search is not None else None,
+        'complementary_search': search_param['negation'] if search is not None else None,
         'select': select,
         'q': q,
         'distinct': distinct}
@@ -76,11 +76,13 @@ async def get_rules(rule_ids: list = None, pretty: bool = False, wait_for_comple
     ConnexionResponse
         API response.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'rule_ids': rule_ids, 'offset': offset, 'limit': limit, 'select': select,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ['id'],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ['id'],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'q': q,
                 'status': status,
                 'group': group,
@@ -134,12 +136,14 @@ async def get_rules_groups(pretty: bool = False, wait_for_complete: bool = False
     ConnexionResponse
         API response.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'offset': offset,
                 'limit': limit,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else [''],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else [''],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 }
 
     dapi = DistributedAPI(f=rule_framework.get_groups,
@@ -183,11 +187,13 @@ async def get_rules_requirement(requirement: str = None, pretty: bool = False, w
     ConnexionResponse
         API response.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'requirement': requirement.replace('-', '_'), 'offset': offset, 'limit': limit,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else [''],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None}
+                'sort_by': sort_param['fields'] if sort is not None else [''],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None}
 
     dapi = DistributedAPI(f=rule_framework.get_requirement,
                           f_kwargs=remove_nones_to_dict(f_kwargs),
@@ -241,12 +247,14 @@ async def get_rules_files(pretty: bool = False, wait_for_complete: bool = False,
     ConnexionResponse
         API response.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'offset': offset,
                 'limit': limit,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ['filename'],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ['filename'],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'status': status,
                 'filename': filename,
                 'relative_dirname': relative_dirname,
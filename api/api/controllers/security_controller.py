@@ -268,11 +268,13 @@ async def get_users(user_ids: list = None, pretty: bool = False, wait_for_comple
     ConnexionResponse
         API response with the users information.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'user_ids': user_ids, 'offset': offset, 'limit': limit, 'select': select,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ['id'],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ['id'],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'q': q,
                 'distinct': distinct}
 
@@ -462,11 +464,13 @@ async def get_roles(role_ids: list = None, pretty: bool = False, wait_for_comple
     ConnexionResponse
         API response with the roles information.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'role_ids': role_ids, 'offset': offset, 'limit': limit, 'select': select,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ['id'],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ['id'],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'q': q,
                 'distinct': distinct
                 }
@@ -620,11 +624,13 @@ async def get_rules(rule_ids: list = None, pretty: bool = False, wait_for_comple
     ConnexionResponse
         API response.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'rule_ids': rule_ids, 'offset': offset, 'limit': limit, 'select': select,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ['id'],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ['id'],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'q': q,
                 'distinct': distinct
                 }
@@ -778,11 +784,13 @@ async def get_policies(policy_ids: list = None, pretty: bool = False, wait_for_c
     ConnexionResponse
         API response with the policies information.
     """
+    sort_param = parse_api_param(sort, 'sort')
+    search_param = parse_api_param(search, 'search')
     f_kwargs = {'policy_ids': policy_ids, 'offset': offset, 'limit': limit, 'select': select,
-                'sort_by': parse_api_param(sort, 'sort')['fields'] if sort is not None else ['id'],
-                'sort_ascending': True if sort is None or parse_api_param(sort, 'sort')['order'] == 'asc' else False,
-                'search_text': parse_api_param(search, 'search')['value'] if search is not None else None,
-                'complementary_search': parse_api_param(search, 'search')['negation'] if search is not None else None,
+                'sort_by': sort_param['fields'] if sort is not None else ['id'],
+                'sort_ascending': True if sort is None or sort_param['order'] == 'asc' else False,
+                'search_text': search_param['value'] if search is not None else None,
+                'complementary_search': search_param['negation'] if search is not None else None,
                 'q': q,
                 'distinct': distinct
                 }
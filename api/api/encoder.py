@@ -2,14 +2,46 @@
 # Created by Wazuh, Inc. <info@wazuh.com>.
 # This program is a free software; you can redistribute it and/or modify it under the terms of GPLv2
 
-import json
+from operator import attrgetter
+from typing import Callable, Dict, Tuple
 
-import six
 from connexion.jsonifier import JSONEncoder
 
 from api.models.base_model_ import Model
 from wazuh.core.results import AbstractWazuhResult
 
+# JSON keys and attribute getter per model class. Generated models declare the same fields for every instance,
+# so the plan is built on the first serialization of each class and reused afterwards
+_PLAN_CACHE: Dict[type, Tuple[Tuple[str, ...], Callable[[Model], tuple]]] = {}
+
+
+def _build_plan(o: Model) -> Tuple[Tuple[str, ...], Callable[[Model], tuple]]:
+    """Build the serialization plan of a model class.
+
+    Parameters
+    ----------
+    o : Model
+        Model instance used to read the class fields.
+
+    Returns
+    -------
+    Tuple[Tuple[str, ...], Callable[[Model], tuple]]
+        JSON keys of the model and a function returning all the attribute values, in the same order, in one call.
+    """
+    attrs = tuple(o.swagger_types)
+    json_attrs = tuple(o.attribute_map[attr] for attr in attrs)
+
+    # `attrgetter` with several names fetches all of them at C level, but it returns a bare value for a single one
+    if len(attrs) > 1:
+        getter = attrgetter(*attrs)
+    elif attrs:
+        single_getter = attrgetter(attrs[0])
+        getter = lambda model: (single_getter(model),)
+    else:
+        getter = lambda model: ()
+
+    return json_attrs, getter
+
 
 class WazuhAPIJSONEncoder(JSONEncoder):
     """"
@@ -31,19 +63,23 @@ class WazuhAPIJSONEncoder(JSONEncoder):
             Dictionary representing the object.
         """
         if isinstance(o, Model):
-            result = {}
-            for attr, _ in six.iteritems(o.swagger_types):
-                value = getattr(o, attr)
-                if value is None and not self.include_nulls:
-                    continue
-                attr = o.attribute_map[attr]
-                result[attr] = value
-            return result
+            plan = _PLAN_CACHE.get(type(o))
+            if plan is None:
+                plan = _PLAN_CACHE[type(o)] = _build_plan(o)
+            json_attrs, getter = plan
+            if self.include_nulls:
+                return dict(zip(json_attrs, getter(o)))
+            return {json_attr: value for json_attr, value in zip(json_attrs, getter(o)) if value is not None}
         elif isinstance(o, AbstractWazuhResult):
             return o.render()
         return JSONEncoder.default(self, o)
 
 
+# Encoders are stateless, so they are built once instead of on every `json.dumps` call
+_ENCODER = WazuhAPIJSONEncoder()
+_PRETTY_ENCODER = WazuhAPIJSONEncoder(indent=3)
+
+
 def dumps(obj: object) -> str:
     """Get a JSON encoded str from an object.
 
@@ -60,7 +96,7 @@ def dumps(obj: object) -> str:
     -------
     str
     """
-    return json.dumps(obj, cls=WazuhAPIJSONEncoder)
+    return _ENCODER.encode(obj)
 
 
 def prettify(obj: object) -> str:
@@ -79,4 +115,4 @@ def prettify(obj: object) -> str:
     -------
     str
     """
-    return json.dumps(obj, cls=WazuhAPIJSONEncoder, indent=3)
+    return _PRETTY_ENCODER.encode(obj)
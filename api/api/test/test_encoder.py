@@ -10,9 +10,37 @@ import pytest
 with patch('wazuh.common.wazuh_uid'):
     with patch('wazuh.common.wazuh_gid'):
         from api.encoder import prettify, dumps
+        from api.models.base_model_ import Model
         from wazuh.core.results import WazuhResult
 
 
+class EncoderModel(Model):
+    def __init__(self, name: str = None, description: str = None):
+        self.swagger_types = {
+            'name': str,
+            'description': str
+        }
+
+        self.attribute_map = {
+            'name': 'name',
+            'description': 'desc'
+        }
+
+        self.name = name
+        self.description = description
+
+
+class SingleFieldModel(Model):
+    def __init__(self, token: str = None):
+        self.swagger_types = {'token': str}
+        self.attribute_map = {'token': 'token'}
+        self.token = token
+
+
+class EmptyModel(Model):
+    pass
+
+
 def custom_hook(dct):
     if 'key' in dct:
         return {'key': dct['key']}
@@ -33,6 +61,19 @@ def test_encoder_dumps(o):
     assert decoded == o
 
 
+@pytest.mark.parametrize('model, expected', [
+    (EncoderModel(name='n1', description='d1'), '{"name": "n1", "desc": "d1"}'),
+    (EncoderModel(name='n2'), '{"name": "n2"}'),
+    (EncoderModel(), '{}'),
+    (SingleFieldModel(token='t1'), '{"token": "t1"}'),
+    (SingleFieldModel(), '{}'),
+    (EmptyModel(), '{}')
+])
+def test_encoder_dumps_model(model, expected):
+    """Test dumps method from API encoder serializes models using their JSON keys and skipping null values."""
+    assert dumps(model) == expected
+
+
 def test_encoder_prettify():
     """Test prettify method from API encoder using WazuhAPIJSONEncoder."""
     assert prettify({'k1': 'v1'}) == '{\n   "k1": "v1"\n}'
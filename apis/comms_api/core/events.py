@@ -1,23 +1,24 @@
 from comms_api.models.events import StatefulEvents, StatelessEvents
 from wazuh.core.engine import get_engine_client
-from wazuh.core.indexer import get_indexer_client
+from wazuh.core.indexer import Indexer
 
 
-async def create_stateful_events(events: StatefulEvents) -> dict:
+async def create_stateful_events(events: StatefulEvents, indexer: Indexer) -> dict:
     """Post new events to the indexer.
     
     Parameters
     ----------
     events : StatefulEvents
         Stateful events list.
+    indexer : Indexer
+        Long-lived indexer client shared by the API worker.
     
     Returns
     -------
     dict
         Dictionary with the indexer response.
     """
-    async with get_indexer_client() as indexer_client:
-        return await indexer_client.events.create(events)
+    return await indexer.events.create(events)
 
 
 async def send_stateless_events(events: StatelessEvents) -> None:
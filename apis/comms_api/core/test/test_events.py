@@ -12,14 +12,12 @@ INDEXER = Indexer(host='host', user='wazuh', password='wazuh')
 
 
 @pytest.mark.asyncio
-@patch('wazuh.core.indexer.create_indexer', return_value=INDEXER)
 @patch('wazuh.core.indexer.events.EventsIndex.create')
-async def test_create_stateful_events(events_create_mock, create_indexer_mock):
+async def test_create_stateful_events(events_create_mock):
     """Check that the `create_stateful_events` function works as expected."""
     events = StatefulEvents(events=[SCAEvent()])
-    await create_stateful_events(events)
+    await create_stateful_events(events, INDEXER)
 
-    create_indexer_mock.assert_called_once()
     events_create_mock.assert_called_once_with(events)
 
 
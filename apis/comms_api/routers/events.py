@@ -1,22 +1,50 @@
-from fastapi import APIRouter, Depends, status, Response
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Request, status, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
 
 from comms_api.authentication.authentication import JWTBearer
 from comms_api.core.events import create_stateful_events, send_stateless_events
 from comms_api.models.events import StatefulEvents, StatelessEvents
 from comms_api.routers.exceptions import HTTPError
-from comms_api.routers.utils import timeout
-from wazuh.core.exception import WazuhEngineError, WazuhError
+from comms_api.routers.utils import get_openapi_request_body, timeout
+from wazuh.core.exception import WazuhEngineError, WazuhError, WazuhIndexerError
+
+
+async def parse_stateful_events(request: Request) -> StatefulEvents:
+    """Decode and validate the stateful events from the raw request body in a single pass.
+
+    Parameters
+    ----------
+    request : Request
+        Incoming HTTP request.
+
+    Raises
+    ------
+    RequestValidationError
+        If the body is not valid JSON or doesn't match the events model.
+
+    Returns
+    -------
+    StatefulEvents
+        Stateful events list.
+    """
+    body = await request.body()
+    try:
+        return StatefulEvents.model_validate_json(body)
+    except ValidationError as exc:
+        # Keep the same error locations FastAPI reports when it validates the body itself
+        raise RequestValidationError([{**error, 'loc': ('body', *error['loc'])} for error in exc.errors()])
 
 
 @timeout(30)
-async def post_stateful_events(events: StatefulEvents) -> JSONResponse:
+async def post_stateful_events(request: Request) -> ORJSONResponse:
     """Post stateful events handler.
 
     Parameters
     ----------
-    events : StatefulEvents
-        Stateful events list.
+    request : Request
+        Incoming HTTP request containing the stateful events list.
 
     Raises
     ------
@@ -25,14 +53,23 @@ async def post_stateful_events(events: StatefulEvents) -> JSONResponse:
 
     Returns
     -------
-    JSONResponse
+    ORJSONResponse
         Indexer response.
     """
+    events = await parse_stateful_events(request)
+    indexer = request.app.state.indexer
+    if indexer is None:
+        # The indexer client could not be created when the worker started, the reason is already logged
+        raise HTTPError(message='The indexer client is not available',
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
     try:
-        response = await create_stateful_events(events)
-        return JSONResponse(response)
+        response = await create_stateful_events(events, indexer)
+        return ORJSONResponse(response)
     except WazuhError as exc:
         raise HTTPError(message=exc.message, status_code=status.HTTP_400_BAD_REQUEST)
+    except WazuhIndexerError as exc:
+        raise HTTPError(message=exc.message, code=exc.code, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 @timeout(10)
@@ -62,5 +99,6 @@ async def post_stateless_events(events: StatelessEvents) -> Response:
 
 
 events_router = APIRouter(prefix='/events')
-events_router.add_api_route('/stateful', post_stateful_events, dependencies=[Depends(JWTBearer())], methods=['POST'])
+events_router.add_api_route('/stateful', post_stateful_events, dependencies=[Depends(JWTBearer())], methods=['POST'],
+                            openapi_extra=get_openapi_request_body(StatefulEvents))
 events_router.add_api_route('/stateless', post_stateless_events, dependencies=[Depends(JWTBearer())], methods=['POST'])
@@ -1,34 +1,81 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import status
+from fastapi.exceptions import RequestValidationError
 
-from comms_api.routers.events import post_stateful_events, post_stateless_events
+from comms_api.models.events import StatefulEvents
+from comms_api.routers.events import parse_stateful_events, post_stateful_events, post_stateless_events
 from comms_api.routers.exceptions import HTTPError
-from wazuh.core.exception import WazuhEngineError, WazuhError
+from wazuh.core.exception import WazuhEngineError, WazuhError, WazuhIndexerError
+from wazuh.core.indexer.models.events import SCAEvent
+
+
+def get_request_mock(body: bytes) -> MagicMock:
+    """Get a request mock returning the given raw body."""
+    request = MagicMock()
+    request.body = AsyncMock(return_value=body)
+    return request
+
+
+@pytest.mark.asyncio
+async def test_parse_stateful_events():
+    """Verify that the `parse_stateful_events` function decodes and validates the request body."""
+    events = await parse_stateful_events(get_request_mock(b'{"events": [{}]}'))
+
+    assert events == StatefulEvents(events=[SCAEvent()])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('body,loc', [
+    (b'{"events": 3}', ('body', 'events')),
+    (b'{"events": [', ('body',)),
+])
+async def test_parse_stateful_events_ko(body, loc):
+    """Verify that the `parse_stateful_events` function raises a request validation error on invalid bodies."""
+    with pytest.raises(RequestValidationError) as exc:
+        await parse_stateful_events(get_request_mock(body))
+
+    assert exc.value.errors()[0]['loc'] == loc
 
 
 @pytest.mark.asyncio
 @patch('comms_api.routers.events.create_stateful_events', return_value={'foo': 'bar'})
 async def test_post_stateful_events(post_stateful_events_mock):
     """Verify that the `post_stateful_events` handler works as expected."""
-    events = []
-    response = await post_stateful_events(events)
+    request = get_request_mock(b'{"events": []}')
+    response = await post_stateful_events(request)
 
-    post_stateful_events_mock.assert_called_once_with(events)
+    post_stateful_events_mock.assert_called_once_with(StatefulEvents(events=[]), request.app.state.indexer)
     assert response.status_code == status.HTTP_200_OK
     assert response.body == b'{"foo":"bar"}'
 
 
 @pytest.mark.asyncio
-async def test_post_stateful_events_ko():
+@pytest.mark.parametrize('exception, code', [
+    (WazuhError(2200), status.HTTP_400_BAD_REQUEST),
+    (WazuhIndexerError(2203), 2203)
+])
+async def test_post_stateful_events_ko(exception, code):
     """Verify that the `post_stateful_events` handler catches exceptions successfully."""
-    code = status.HTTP_400_BAD_REQUEST
-    exception = WazuhError(2200)
 
     with patch('comms_api.routers.events.create_stateful_events', MagicMock(side_effect=exception)):
         with pytest.raises(HTTPError, match=fr'{code}: {exception.message}'):
-            _ = await post_stateful_events('')
+            _ = await post_stateful_events(get_request_mock(b'{"events": []}'))
+
+
+@pytest.mark.asyncio
+@patch('comms_api.routers.events.create_stateful_events')
+async def test_post_stateful_events_no_indexer(create_stateful_events_mock):
+    """Verify that the `post_stateful_events` handler fails when the indexer client is not available."""
+    request = get_request_mock(b'{"events": []}')
+    request.app.state.indexer = None
+
+    code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    with pytest.raises(HTTPError, match=fr'{code}: The indexer client is not available'):
+        _ = await post_stateful_events(request)
+
+    create_stateful_events_mock.assert_not_called()
 
 
 @pytest.mark.asyncio
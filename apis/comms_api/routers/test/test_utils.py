@@ -2,9 +2,10 @@ from asyncio import sleep
 
 import pytest
 from fastapi import status
+from pydantic import BaseModel
 
 from comms_api.routers.exceptions import HTTPError
-from comms_api.routers.utils import DEFAULT_TIMEOUT, timeout
+from comms_api.routers.utils import DEFAULT_TIMEOUT, get_openapi_request_body, timeout
 
 
 @pytest.mark.asyncio
@@ -31,3 +32,23 @@ async def test_timeout(timeout_seconds, sleep_seconds):
         message = 'Request exceeded the processing time limit'
         with pytest.raises(HTTPError, match=fr'{status.HTTP_408_REQUEST_TIMEOUT}: {message}'):
             _ = await f()
+
+
+class Child(BaseModel):
+    name: str
+
+
+class Parent(BaseModel):
+    children: list[Child]
+
+
+def test_get_openapi_request_body():
+    """Verify that the `get_openapi_request_body` function inlines the nested models in the request body schema."""
+    request_body = get_openapi_request_body(Parent)
+
+    assert request_body == {'requestBody': {'content': {'application/json': {'schema': {
+        'properties': {'children': {'items': Child.model_json_schema(), 'title': 'Children', 'type': 'array'}},
+        'required': ['children'],
+        'title': 'Parent',
+        'type': 'object'
+    }}}, 'required': True}}
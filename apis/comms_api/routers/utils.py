@@ -1,14 +1,18 @@
 import asyncio
 import logging
 from functools import wraps
+from typing import Any, Type
 
 from fastapi import status
+from pydantic import BaseModel
 
 from comms_api.routers.exceptions import HTTPError
 
 logger = logging.getLogger('wazuh-comms-api')
 
 DEFAULT_TIMEOUT = 10
+DEFS_KEY = '$defs'
+REF_KEY = '$ref'
 
 
 def timeout(seconds: float = DEFAULT_TIMEOUT):
@@ -29,3 +33,34 @@ def timeout(seconds: float = DEFAULT_TIMEOUT):
         return wrapper
 
     return decorator
+
+
+def get_openapi_request_body(model: Type[BaseModel]) -> dict:
+    """Get the OpenAPI request body specification of an endpoint that validates the body on its own.
+
+    The nested models are inlined, as their references point to the schema itself and cannot be resolved from the
+    OpenAPI document.
+
+    Parameters
+    ----------
+    model : Type[BaseModel]
+        Model of the request body.
+
+    Returns
+    -------
+    dict
+        Request body specification, to be passed in the route `openapi_extra`.
+    """
+    schema = model.model_json_schema()
+    definitions = schema.pop(DEFS_KEY, {})
+
+    def inline(value: Any) -> Any:
+        if isinstance(value, dict):
+            if REF_KEY in value:
+                return inline(definitions[value[REF_KEY].rsplit('/', 1)[-1]])
+            return {k: inline(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [inline(v) for v in value]
+        return value
+
+    return {'requestBody': {'content': {'application/json': {'schema': inline(schema)}}, 'required': True}}
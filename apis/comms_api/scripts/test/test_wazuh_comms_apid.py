@@ -0,0 +1,36 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from comms_api.scripts.wazuh_comms_apid import lifespan
+from wazuh.core.exception import WazuhIndexerError
+
+
+@pytest.mark.asyncio
+@patch('comms_api.scripts.wazuh_comms_apid.get_indexer')
+async def test_lifespan(get_indexer_mock):
+    """Verify that the `lifespan` function shares the indexer client and closes it on shutdown."""
+    indexer_mock = AsyncMock()
+    get_indexer_mock.return_value = indexer_mock
+    app = MagicMock()
+
+    async with lifespan(app):
+        get_indexer_mock.assert_called_once_with()
+        assert app.state.indexer == indexer_mock
+        indexer_mock.connect.assert_not_called()
+        indexer_mock.close.assert_not_called()
+
+    indexer_mock.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch('comms_api.scripts.wazuh_comms_apid.get_indexer', side_effect=WazuhIndexerError(2201))
+async def test_lifespan_ko(get_indexer_mock):
+    """Verify that the `lifespan` function does not fail when the indexer client cannot be created."""
+    app = MagicMock()
+
+    with patch('comms_api.scripts.wazuh_comms_apid.logging.getLogger') as get_logger_mock:
+        async with lifespan(app):
+            assert app.state.indexer is None
+
+    get_logger_mock.return_value.error.assert_called_once()
@@ -4,13 +4,15 @@ import os
 import signal
 import ssl
 from argparse import ArgumentParser, Namespace
+from contextlib import asynccontextmanager
 from functools import partial
 from sys import exit
-from typing import Any, Callable, Dict
+from typing import Any, AsyncIterator, Callable, Dict
 
 from brotli_asgi import BrotliMiddleware
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from gunicorn.app.base import BaseApplication
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -23,14 +25,44 @@ from comms_api.routers.exceptions import HTTPError, http_error_handler, validati
 from comms_api.routers.router import router
 from comms_api.middlewares.logging import LoggingMiddleware
 from wazuh.core import common, pyDaemonModule, utils
-from wazuh.core.exception import WazuhCommsAPIError
+from wazuh.core.exception import WazuhCommsAPIError, WazuhIndexerError
+from wazuh.core.indexer import get_indexer
 
 MAIN_PROCESS = 'wazuh-comms-apid'
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open the indexer client when the worker starts and close it on shutdown.
+
+    The client is shared by the requests handled in the worker, so the connection pool is reused instead of being
+    created for each request. The client connects lazily, so an unavailable indexer makes the requests fail instead
+    of the worker boot. If the client cannot be created, the error is logged and the endpoints that depend on it
+    answer with an error, while the rest of the API keeps working.
+
+    Parameters
+    ----------
+    app : FastAPI
+        Application instance.
+    """
+    try:
+        indexer_client = get_indexer()
+    except WazuhIndexerError as e:
+        logging.getLogger('wazuh-comms-api').error(f'Could not create the indexer client. {e}')
+        indexer_client = None
+
+    app.state.indexer = indexer_client
+
+    try:
+        yield
+    finally:
+        if indexer_client is not None:
+            await indexer_client.close()
+
+
 def create_app() -> FastAPI:
     """Creates a FastAPI application instance and adds middlewares, exceptions handlers and routers to it."""
-    app = FastAPI()
+    app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
     app.add_middleware(SecureHeadersMiddleware)
     app.add_middleware(BrotliMiddleware)
     app.add_middleware(LoggingMiddleware)
@@ -441,6 +441,7 @@ class WazuhException(Exception):
         2200: {'message': 'Could not connect to the indexer'},
         2201: {'message': 'Indexer credentials not provided'},
         2202: {'message': 'Command does not exist'},
+        2203: {'message': 'Some events could not be created'},
 
         # Communications API
         2700: {'message': 'Private key does not match with the certificate'},
@@ -162,20 +162,46 @@ async def create_indexer(
             retries_count += 1
 
 
+def get_indexer_settings() -> dict:
+    """Get the Wazuh Indexer connection settings from the environment.
+
+    Returns
+    -------
+    dict
+        Keyword arguments to create the Indexer instance with.
+    """
+    return {
+        'host': INDEXER_HOST,
+        'user': INDEXER_USER,
+        'password': INDEXER_PASSWORD,
+        'use_ssl': INDEXER_USE_SSL,
+        'client_cert_path': INDEXER_CLIENT_CERT_PATH,
+        'client_key_path': INDEXER_CLIENT_KEY_PATH,
+        'ca_certs_path': INDEXER_CA_CERTS_PATH,
+    }
+
+
+def get_indexer() -> Indexer:
+    """Create the indexer client from the environment settings without connecting to it.
+
+    Raises
+    ------
+    WazuhIndexerError(2201)
+        If the indexer credentials are not provided.
+
+    Returns
+    -------
+    Indexer
+        The new Indexer instance.
+    """
+    return Indexer(**get_indexer_settings())
+
+
 @asynccontextmanager
 async def get_indexer_client() -> AsyncIterator[Indexer]:
     """Create and return the indexer client."""
 
-    client = await create_indexer(
-        host=INDEXER_HOST,
-        user=INDEXER_USER,
-        password=INDEXER_PASSWORD,
-        use_ssl=INDEXER_USE_SSL,
-        client_cert_path=INDEXER_CLIENT_CERT_PATH,
-        client_key_path=INDEXER_CLIENT_KEY_PATH,
-        ca_certs_path=INDEXER_CA_CERTS_PATH,
-        retries=1
-    )
+    client = await create_indexer(**get_indexer_settings(), retries=1)
 
     try:
         yield client
@@ -28,6 +28,8 @@ class IndexerKey(str, Enum):
     TERMS = 'terms'
     CONFLICTS = 'conflicts'
     ITEMS = 'items'
+    ERRORS = 'errors'
+    ERROR = 'error'
 
 
 class BaseIndex:
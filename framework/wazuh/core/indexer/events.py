@@ -1,9 +1,36 @@
 from dataclasses import asdict
+from functools import lru_cache
 from typing import List
 
-from .base import BaseIndex
+import orjson
+from opensearchpy.serializer import JSONSerializer
+
+from .base import BaseIndex, IndexerKey
+from wazuh.core.exception import WazuhIndexerError
 from wazuh.core.indexer.models.events import StatefulEvent
 
+REASON_KEY = 'reason'
+
+# Types orjson does not support natively are encoded the same way the OpenSearch client serializer does
+_DEFAULT = JSONSerializer().default
+
+
+@lru_cache()
+def get_create_action(index: str) -> bytes:
+    """Get the encoded bulk `create` action line for an index.
+
+    Parameters
+    ----------
+    index : str
+        Index name.
+
+    Returns
+    -------
+    bytes
+        JSON encoded action.
+    """
+    return orjson.dumps({IndexerKey.CREATE.value: {IndexerKey._INDEX.value: index}})
+
 
 class EventsIndex(BaseIndex):
     """Set of methods to interact with the stateful events indices."""
@@ -15,16 +42,38 @@ class EventsIndex(BaseIndex):
         ----------
         events : Events
             List of events.
-        
+
+        Raises
+        ------
+        WazuhIndexerError(2203)
+            If the indexer failed to create any of the events.
+
         Returns
         -------
         dict
             Indexer response for each one of the events.
         """
         # TODO(#24713): Implement server to indexer events batching
-        response = {}
-        for i, event in enumerate(events.events):
-            resp = await self._client.create(index=event.get_index_name(), body=asdict(event))
-            response.update({f'{i}': resp})
+        if not events.events:
+            return {}
+
+        lines = []
+        for event in events.events:
+            lines.append(get_create_action(event.get_index_name()))
+            lines.append(orjson.dumps(asdict(event), default=_DEFAULT))
+
+        # All the events are sent in a single bulk request, already encoded as NDJSON
+        response = await self._client.bulk(b'\n'.join(lines) + b'\n')
+        items = {f'{i}': item[IndexerKey.CREATE] for i, item in enumerate(response[IndexerKey.ITEMS])}
+
+        # The bulk API does not fail when some of the operations do, so the errors are checked here
+        if response[IndexerKey.ERRORS]:
+            errors = {i: item[IndexerKey.ERROR] for i, item in items.items() if IndexerKey.ERROR in item}
+            self._logger.error(f'Failed to create {len(errors)} of {len(items)} events: {errors}')
+            first_error = next(iter(errors.values()))
+            raise WazuhIndexerError(
+                2203,
+                extra_message=f'{len(errors)} of {len(items)} failed, first error: {first_error.get(REASON_KEY)}'
+            )
 
-        return response
+        return items
@@ -0,0 +1,73 @@
+from dataclasses import asdict
+from unittest import mock
+
+import orjson
+import pytest
+
+from wazuh.core.exception import WazuhIndexerError
+from wazuh.core.indexer.base import IndexerKey
+from wazuh.core.indexer.events import EventsIndex, get_create_action
+from wazuh.core.indexer.models.events import SCAEvent, SCA_INDEX
+
+
+def test_get_create_action():
+    """Check the correct function of `get_create_action` function."""
+    assert get_create_action(SCA_INDEX) == b'{"create":{"_index":"%s"}}' % SCA_INDEX.encode()
+
+
+class TestEventsIndex:
+    index_class = EventsIndex
+
+    @pytest.fixture
+    def client_mock(self) -> mock.AsyncMock:
+        return mock.AsyncMock()
+
+    @pytest.fixture
+    def index_instance(self, client_mock) -> EventsIndex:
+        return self.index_class(client=client_mock)
+
+    async def test_create(self, index_instance: EventsIndex, client_mock: mock.AsyncMock):
+        """Check the correct function of `create` method."""
+        events = mock.MagicMock(events=[SCAEvent(), SCAEvent()])
+        items = [{IndexerKey.CREATE: {IndexerKey._INDEX: SCA_INDEX, 'status': 201}} for _ in events.events]
+        client_mock.bulk.return_value = {IndexerKey.ERRORS: False, IndexerKey.ITEMS: items}
+
+        response = await index_instance.create(events)
+
+        expected_lines = []
+        for event in events.events:
+            expected_lines.append(get_create_action(SCA_INDEX))
+            expected_lines.append(orjson.dumps(asdict(event)))
+
+        client_mock.bulk.assert_called_once_with(b'\n'.join(expected_lines) + b'\n')
+        assert response == {'0': items[0][IndexerKey.CREATE], '1': items[1][IndexerKey.CREATE]}
+
+    async def test_create_empty(self, index_instance: EventsIndex, client_mock: mock.AsyncMock):
+        """Check that `create` does not send any request when there are no events."""
+        response = await index_instance.create(mock.MagicMock(events=[]))
+
+        client_mock.bulk.assert_not_called()
+        assert response == {}
+
+    async def test_create_ko(self, index_instance: EventsIndex, client_mock: mock.AsyncMock):
+        """Check that `create` raises an error when the indexer fails to create any of the events."""
+        events = mock.MagicMock(events=[SCAEvent(), SCAEvent(), SCAEvent()])
+        first_error = {'type': 'mapper_parsing_exception', 'reason': 'failed to parse'}
+        second_error = {'type': 'version_conflict_engine_exception', 'reason': 'document already exists'}
+        client_mock.bulk.return_value = {
+            IndexerKey.ERRORS: True,
+            IndexerKey.ITEMS: [
+                {IndexerKey.CREATE: {IndexerKey._INDEX: SCA_INDEX, 'status': 201}},
+                {IndexerKey.CREATE: {IndexerKey._INDEX: SCA_INDEX, 'status': 400, IndexerKey.ERROR: first_error}},
+                {IndexerKey.CREATE: {IndexerKey._INDEX: SCA_INDEX, 'status': 409, IndexerKey.ERROR: second_error}}
+            ]
+        }
+
+        with mock.patch.object(index_instance._logger, 'error') as logger_error_mock:
+            with pytest.raises(WazuhIndexerError) as exc:
+                await index_instance.create(events)
+
+        assert exc.value.code == 2203
+        assert exc.value.message == 'Some events could not be created: 2 of 3 failed, first error: failed to parse'
+        errors = {'1': first_error, '2': second_error}
+        logger_error_mock.assert_called_once_with(f'Failed to create 2 of 3 events: {errors}')
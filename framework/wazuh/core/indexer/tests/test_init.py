@@ -3,7 +3,7 @@ from unittest import mock
 import pytest
 from opensearchpy import AsyncOpenSearch
 from wazuh.core.exception import WazuhIndexerError
-from wazuh.core.indexer import Indexer, create_indexer, get_indexer_client
+from wazuh.core.indexer import Indexer, create_indexer, get_indexer, get_indexer_client
 
 
 @pytest.fixture
@@ -120,3 +120,18 @@ async def test_get_indexer_client(create_indexer_mock):
         )
         assert indexer == client_mock
     client_mock.close.assert_called_once()
+
+
+@mock.patch('wazuh.core.indexer.Indexer')
+def test_get_indexer(indexer_mock):
+    """Check the correct function of `get_indexer`."""
+    assert get_indexer() == indexer_mock.return_value
+    indexer_mock.assert_called_once_with(
+        host='',
+        user='',
+        password='',
+        use_ssl=True,
+        client_cert_path='',
+        client_key_path='',
+        ca_certs_path='',
+    )
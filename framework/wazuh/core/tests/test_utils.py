@@ -368,6 +368,10 @@ def test_process_array(array, q, filters, limit, search_text, sort_by, select, d
     assert result == {'items': expected_items, 'totalItems': expected_total_items}
 
 
+@pytest.mark.parametrize('allowed_select_fields, cut_before_select', [
+    (None, False),
+    (['item'], True)
+])
 @patch('wazuh.core.utils.len', return_value=1)
 @patch('wazuh.core.utils.cut_array')
 @patch('wazuh.core.utils.select_array', return_value=ANY)
@@ -375,9 +379,10 @@ def test_process_array(array, q, filters, limit, search_text, sort_by, select, d
 @patch('wazuh.core.utils.search_array', return_value=ANY)
 @patch('wazuh.core.utils.sort_array', return_value=ANY)
 def test_process_array_ops_order(mock_sort_array, mock_search_array, mock_filter_array_by_query, mock_select_array,
-                                 mock_cut_array, mock_len):
+                                 mock_cut_array, mock_len, allowed_select_fields, cut_before_select):
     """Test that the process_array function calls the sort, search, filter by query, select and cut operations in the
-    expected order and with the expected parameters."""
+    expected order and with the expected parameters. The array is only cut before selecting the fields when these are
+    validated against `allowed_select_fields` instead of against every item."""
     manager_mock = Mock()
     manager_mock.attach_mock(mock_sort_array, 'mock_sort_array')
     manager_mock.attach_mock(mock_search_array, 'mock_search_array')
@@ -387,7 +392,11 @@ def test_process_array_ops_order(mock_sort_array, mock_search_array, mock_filter
 
     utils.process_array(array=[{'item': 'value_1'}, {'item': 'value_2'}, {'item': 'value_3'}],
                         filters={'item': 'value_1'}, limit=1, offset=0, search_text='e_1', select=['item'],
-                        sort_by=['item'], q='item~value')
+                        sort_by=['item'], q='item~value', allowed_select_fields=allowed_select_fields)
+
+    select_call = call.mock_select_array(ANY, select=['item'], required_fields=None,
+                                         allowed_select_fields=allowed_select_fields)
+    cut_call = call.mock_cut_array(ANY, offset=0, limit=1)
 
     # The array in the sort_array function parameter is the initial one after the filters
     # The array parameter of the other functions is ANY
@@ -395,9 +404,38 @@ def test_process_array_ops_order(mock_sort_array, mock_search_array, mock_filter
         call.mock_sort_array([{'item': 'value_1'}], sort_by=['item'], sort_ascending=True, allowed_sort_fields=None),
         call.mock_search_array(ANY, search_text='e_1', complementary_search=False, search_in_fields=None),
         call.mock_filter_array_by_query('item~value', ANY),
-        call.mock_select_array(ANY, select=['item'], required_fields=None, allowed_select_fields=None),
-        call.mock_cut_array(ANY, offset=0, limit=1)
+        *([cut_call, select_call] if cut_before_select else [select_call, cut_call])
+    ]
+
+
+@pytest.mark.parametrize('array, offset, limit', [
+    ([{'a': 1}, {'a': 2}], 5, None),
+    ([{'a': 1}, {'b': 2}], 1, 1)
+])
+def test_process_array_invalid_select(array, offset, limit):
+    """Test that the process_array function validates the select fields against every item, even those that are not
+    part of the returned page."""
+    with pytest.raises(utils.WazuhError, match=r'\b1724\b'):
+        utils.process_array(array=array, select=['b'], offset=offset, limit=limit)
+
+
+@patch('wazuh.core.utils.cut_array')
+@patch('wazuh.core.utils.select_array', return_value=[{'item': 'value_1'}, {'item': 'value_1'}])
+def test_process_array_distinct_ops_order(mock_select_array, mock_cut_array):
+    """Test that the process_array function selects the fields before cutting the array when looking for distinct
+    values, as the number of items depends on the selected fields."""
+    manager_mock = Mock()
+    manager_mock.attach_mock(mock_select_array, 'mock_select_array')
+    manager_mock.attach_mock(mock_cut_array, 'mock_cut_array')
+
+    result = utils.process_array(array=[{'item': 'value_1', 'id': 1}, {'item': 'value_1', 'id': 2}], limit=1,
+                                 offset=0, select=['item'], distinct=True)
+
+    assert manager_mock.mock_calls == [
+        call.mock_select_array(ANY, select=['item'], required_fields=set(), allowed_select_fields=None),
+        call.mock_cut_array([{'item': 'value_1'}], offset=0, limit=1)
     ]
+    assert result['totalItems'] == 1
 
 
 def test_sort_array_type():
@@ -446,6 +484,30 @@ def test_sort_array(array, sort_by, order, allowed_sort_field, output):
     assert utils.sort_array(array, sort_by, order, allowed_sort_field) == output
 
 
+@pytest.mark.parametrize('sort_ascending, expected_names, missing_key_index', [
+    (True, ['alice', 'Bob', 'carol'], 0),
+    (False, ['carol', 'Bob', 'alice'], -1)
+])
+def test_sort_array_branches(sort_ascending, expected_names, missing_key_index):
+    """Test the sort_array function with dictionaries, objects and dictionaries missing the sorting key.
+
+    String values are sorted ignoring their case. The items missing the sorting key are placed at the beginning
+    (ascending) or at the end (descending) of the array.
+    """
+    names = ['carol', 'alice', 'Bob']
+
+    dict_array = [{'name': name} for name in names]
+    assert [item['name'] for item in utils.sort_array(dict_array, ['name'], sort_ascending)] == expected_names
+
+    class_array = [ClassTest(name=name) for name in names]
+    assert [item.name for item in utils.sort_array(class_array, ['name'], sort_ascending)] == expected_names
+
+    missing_key_item = {'job': 'coach'}
+    result = utils.sort_array(dict_array + [missing_key_item], ['name'], sort_ascending, allowed_sort_fields=['name'])
+    assert result[missing_key_index] == missing_key_item
+    assert len(result) == len(names) + 1 and all(item in result for item in dict_array)
+
+
 @pytest.mark.parametrize('object, fields', [
     ({'test': 'test'}, None),
     ({'test': 'test'}, ['test']),
@@ -460,6 +522,16 @@ def test_get_values(object, fields):
     assert isinstance(result[0], str)
 
 
+def test_iter_values():
+    """Test iter_values function yields the same values as get_values, lazily."""
+    dikt = {'name': 'Test', 'groups': ['A', 'b'], 'id': 1, 'other': {'key': 'Value'}}
+    values = utils.iter_values(o=dikt, fields=['name', 'groups', 'id'])
+
+    assert next(values) == 'test'
+    assert list(values) == ['a', 'b', '1']
+    assert list(utils.iter_values(o=dikt)) == utils.get_values(o=dikt)
+
+
 @pytest.mark.parametrize('array, text, negation, length', [
     (['test', 'name'], 'e', False, 2),
     (['test', 'name'], 'name', False, 1),
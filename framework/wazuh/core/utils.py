@@ -203,6 +203,13 @@ def process_array(array: list, search_text: str = None, complementary_search: bo
     if q:
         array = filter_array_by_query(q, array)
 
+    # Selecting fields keeps the number of items, so the array can be cut first and only the returned items built.
+    # Without `allowed_select_fields`, `select_array` validates the fields against every item, so it must get them all
+    cut_before_select = not distinct and (not select or allowed_select_fields)
+    if cut_before_select:
+        total_items = len(array)
+        array = cut_array(array, offset=offset, limit=limit)
+
     if select:
         # Do not force the inclusion of any fields when we are looking for distinct values
         required_fields = set() if distinct else required_fields
@@ -217,7 +224,11 @@ def process_array(array: list, search_text: str = None, complementary_search: bo
 
         array = distinct_array
 
-    return {'items': cut_array(array, offset=offset, limit=limit), 'totalItems': len(array)}
+    if not cut_before_select:
+        total_items = len(array)
+        array = cut_array(array, offset=offset, limit=limit)
+
+    return {'items': array, 'totalItems': total_items}
 
 
 def cut_array(array: list, offset: int = 0, limit: int = common.DATABASE_LIMIT) -> list:
@@ -322,7 +333,7 @@ def sort_array(array: list, sort_by: list = None, sort_ascending: bool = True,
             try:
                 return sorted(array,
                               key=lambda o: tuple(
-                                  o.get(a).lower() if type(o.get(a)) in (str, unicode) else o.get(a) for a in sort_by),
+                                  v.lower() if type(v) in (str, unicode) else v for v in (o.get(a) for a in sort_by)),
                               reverse=not sort_ascending)
             except TypeError:
                 items_with_missing_keys = list()
@@ -332,7 +343,7 @@ def sort_array(array: list, sort_by: list = None, sort_ascending: bool = True,
                         copy_array.pop(copy_array.index(item)))
 
                 sorted_array = sorted(copy_array, key=lambda o: tuple(
-                    o.get(a).lower() if type(o.get(a)) in (str, unicode) else o.get(a) for a in sort_by),
+                    v.lower() if type(v) in (str, unicode) else v for v in (o.get(a) for a in sort_by)),
                                       reverse=not sort_ascending)
 
                 if not sort_ascending:
@@ -345,8 +356,7 @@ def sort_array(array: list, sort_by: list = None, sort_ascending: bool = True,
         else:
             return sorted(array,
                           key=lambda o: tuple(
-                              getattr(o, a).lower() if type(getattr(o, a)) in (str, unicode) else getattr(o, a)
-                              for a in sort_by),
+                              v.lower() if type(v) in (str, unicode) else v for v in (getattr(o, a) for a in sort_by)),
                           reverse=not sort_ascending)
     else:
         if type(array) is set or (type(array[0]) is not dict and 'class \'wazuh' not in str(type(array[0]))):
@@ -355,8 +365,8 @@ def sort_array(array: list, sort_by: list = None, sort_ascending: bool = True,
             return array
 
 
-def get_values(o: object, fields: list = None) -> list:
-    """Convert the values of an object to an array of strings.
+def iter_values(o: object, fields: list = None) -> typing.Iterator[str]:
+    """Lazily convert the values of an object to strings.
 
     Parameters
     ----------
@@ -365,13 +375,11 @@ def get_values(o: object, fields: list = None) -> list:
     fields : list
         Fields to get values of (only for dictionaries).
 
-    Returns
-    -------
-    list
-        Array of strings.
+    Yields
+    ------
+    str
+        Object values as strings, lowercased when they are strings.
     """
-    strings = []
-
     try:
         obj = o.to_dict()  # Rule, Decoder, Agent...
     except:
@@ -379,15 +387,31 @@ def get_values(o: object, fields: list = None) -> list:
 
     if type(obj) is list:
         for o in obj:
-            strings.extend(get_values(o))
+            yield from iter_values(o)
     elif type(obj) is dict:
         for key in obj:
             if not fields or key in fields:
-                strings.extend(get_values(obj[key]))
+                yield from iter_values(obj[key])
     else:
-        strings.append(obj.lower() if isinstance(obj, str) or isinstance(obj, unicode) else str(obj))
+        yield obj.lower() if isinstance(obj, str) or isinstance(obj, unicode) else str(obj)
+
+
+def get_values(o: object, fields: list = None) -> list:
+    """Convert the values of an object to an array of strings.
+
+    Parameters
+    ----------
+    o : object
+        Object.
+    fields : list
+        Fields to get values of (only for dictionaries).
 
-    return strings
+    Returns
+    -------
+    list
+        Array of strings.
+    """
+    return list(iter_values(o, fields))
 
 
 def search_array(array, search_text: str = None, complementary_search: bool = False,
@@ -411,27 +435,13 @@ def search_array(array, search_text: str = None, complementary_search: bool = Fa
         Filtered array.
     """
 
-    found = []
-
-    for item in array:
-
-        values = get_values(o=item, fields=search_in_fields)
-
-        if not complementary_search:
-            for v in values:
-                if search_text.lower() in v:
-                    found.append(item)
-                    break
-        else:
-            not_in_values = True
-            for v in values:
-                if search_text.lower() in v:
-                    not_in_values = False
-                    break
-            if not_in_values:
-                found.append(item)
+    search_text = search_text.lower()
+    # Items are kept when the text is found in any of their values, or when it is not found in complementary searches
+    keep_matches = not complementary_search
 
-    return found
+    # Values are generated lazily, so the rest of an item is not converted once the text has been found
+    return [item for item in array
+            if any(search_text in v for v in iter_values(o=item, fields=search_in_fields)) is keep_matches]
 
 
 def select_array(array: list, select: list = None, required_fields: set = None,